@@ -3,7 +3,7 @@
 toio 用 RobotConfig 定義。
 - カメラ設定
 - モータ/制御ゲイン
-- BLE スキャン設定（名前プレフィックス + タイムアウト）
+- BLE 設定（スキャン名プレフィックス + タイムアウト、書き込み間隔）
 
 補足:
 - x 側（旋回）の相対比は kw/kv で決まります。
@@ -21,6 +21,7 @@ from lerobot.robots.config import RobotConfig
 class ToioConfig(RobotConfig):
     # ---- カメラ設定 ----
     cameras: Dict[str, CameraConfig] = field(default_factory=dict)
+    camera_read_timeout_s: float = 0.2  # 1 フレーム取得の待ち上限[s]（超えたらゼロ画像でフォールバック）
 
     # ---- モータ/制御ゲイン ----
     max_motor: int = 80               # モータ出力のクリップ上限（±max_motor）
@@ -29,6 +30,11 @@ class ToioConfig(RobotConfig):
     deadzone: float = 0.05            # 小さなモータ値は 0 に潰す比率（±max_motor に対する割合）
     integrate_pose: bool = True       # （拡張用フラグ、ここでは未使用）
 
-    # ---- BLE スキャン設定 ----
+    # ---- BLE 設定 ----
     ble_name_prefix: str = "toio"     # スキャン時のデバイス名プレフィックス
     ble_scan_timeout_s: float = 8.0   # bleak によるスキャンのタイムアウト
+    prefer_bleak_scan: bool = False   # True で toio ライブラリの自動スキャンを省き、最初から bleak でスキャン
+    # アクティブスキャン（SCAN_REQ で早く見つかる代わりに電波使用が増える）。
+    # False（passive）は Windows と Linux（BlueZ、名前プレフィックスの or_patterns を自動指定）のみ。macOS は不可。
+    ble_active_scan: bool = True
+    ble_min_interval_s: float = 0.02  # モータ指令の BLE 書き込み最小間隔[s]（超過分は最新値に合流）
@@ -8,10 +8,16 @@ toio を lerobot の Robot として扱うための実装。
 
 from __future__ import annotations
 
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import logging
 import threading
 import asyncio
 import inspect
+import sys
+import time
+import uuid
 import numpy as np
 
 from lerobot.cameras import make_cameras_from_configs
@@ -21,10 +27,53 @@ from lerobot.robots.robot import Robot
 # 同一ディレクトリ（パッケージ）内の設定クラス
 from .config_toio import ToioConfig
 
+logger = logging.getLogger(__name__)
 
-def _clip(v: int, lo: int, hi: int) -> int:
-    """整数 v を [lo, hi] にクリップする小ヘルパ。"""
-    return lo if v < lo else hi if v > hi else v
+# toio ライブラリのバージョン差を吸収するため、アドレスを渡し得る引数名の候補
+_CUBE_ADDRESS_KEYS = ("address", "mac_address", "device", "target", "target_addr")
+
+# toio Core Cube のサービス UUID（toio-py の TOIO_UUID_SERVICE と同じ値）
+# 広告パケット本体に載るため、スキャン応答（名前）を受け取らない passive スキャンでもこれで識別できる
+_TOIO_SERVICE_UUID = uuid.UUID("10B20100-5B3B-4571-9508-CF3EFCD7BBAE")
+
+# 直近に bleak スキャンで見つけて接続できた toio（bleak.BLEDevice）
+# 再接続時はまずこれに直接つなぎ、失敗したときだけスキャンし直す
+_LAST_KNOWN_CUBE: Optional[Any] = None
+
+# ToioCoreCube.__init__ が受け付ける引数名（プロセス内で 1 度だけ inspect して使い回す）
+_CUBE_INIT_PARAMS: frozenset[str] | None = None
+
+
+def _get_cube_params(cube_cls: Any) -> frozenset[str]:
+    """ToioCoreCube の引数名集合を遅延取得する。署名が取れない場合は空集合（何も渡さない）。"""
+    global _CUBE_INIT_PARAMS
+    if _CUBE_INIT_PARAMS is None:
+        try:
+            _CUBE_INIT_PARAMS = frozenset(inspect.signature(cube_cls).parameters.keys())
+        except Exception:
+            # 署名取得に失敗した場合は安全側で何も渡さない
+            _CUBE_INIT_PARAMS = frozenset()
+    return _CUBE_INIT_PARAMS
+
+
+def _make_cam_reader(cam: Any) -> Callable[[], Optional[np.ndarray]]:
+    """
+    カメラからフレームを 1 枚取り出す呼び出し可能オブジェクトを返す。
+    - async_read があればそれをそのまま使う
+    - read のみなら (ok, frame) を展開し、失敗時は None を返すラッパにする
+    - どちらも無ければ常に None（ゼロ画像フォールバック）
+    """
+    if hasattr(cam, "async_read"):
+        return cam.async_read
+    if hasattr(cam, "read"):
+        read = cam.read
+
+        def _read() -> Optional[np.ndarray]:
+            ok, frame = read()
+            return None if ok is False else frame
+
+        return _read
+    return lambda: None
 
 
 class _ToioAsyncRunner:
@@ -34,7 +83,15 @@ class _ToioAsyncRunner:
     - ランナー内部で BLE 接続と非同期送信を処理
     """
 
-    def __init__(self, *, ble_name_prefix: str, ble_scan_timeout_s: float):
+    def __init__(
+        self,
+        *,
+        ble_name_prefix: str,
+        ble_scan_timeout_s: float,
+        prefer_bleak_scan: bool,
+        ble_active_scan: bool,
+        ble_min_interval_s: float,
+    ):
         # 独自のイベントループをバックグラウンドスレッドで持つ
         self._loop = asyncio.new_event_loop()
         self._thread = threading.Thread(target=self._loop_main, name="toio-async", daemon=True)
@@ -42,13 +99,32 @@ class _ToioAsyncRunner:
         self._stop_evt = threading.Event()   # 停止指示
         self._exc: Optional[BaseException] = None  # 起動時の例外（あれば保持）
 
-        # モータ指令キュー（最新指令のみを保持する設計）
-        self._queue: "asyncio.Queue[Tuple[int, int] | str]" = None  # type: ignore
+        # モータ指令スロット（maxlen=1 の deque で「最新指令のみ」を保持）
+        # - append はメインスレッドから直接行い、ループへの通知は _wake のみ
+        # - _wake_pending で通知済みなら call_soon_threadsafe を省く
+        self._slot: "deque[Tuple[int, int]]" = deque(maxlen=1)
+        self._wake = asyncio.Event()
+        self._wake_pending = False
         self._last_cmd: Optional[Tuple[int, int]] = None
 
+        # 投入時点での重複排除（直前に投入した指令と同じなら通知ごと省く）
+        self._last_enqueued: Optional[Tuple[int, int]] = None
+        self._enq_lock = threading.Lock()
+
         # BLE スキャン設定（アドレス指定は廃止）
         self._ble_name_prefix = ble_name_prefix
         self._ble_scan_timeout_s = ble_scan_timeout_s
+        self._prefer_bleak_scan = prefer_bleak_scan
+        self._ble_active_scan = ble_active_scan
+        if not ble_active_scan and sys.platform == "darwin":
+            # CoreBluetooth は passive スキャン非対応（bleak が BleakError を投げる）ので起動前に弾く
+            raise ValueError(
+                "toio: ble_active_scan=False (passive scan) は macOS では使えません。"
+                "ble_active_scan=True を指定してください。"
+            )
+
+        # BLE 書き込みの最小間隔（これより速い指令は最新 1 件に合流させる）
+        self._ble_min_interval_s = ble_min_interval_s
 
     # --- ライフサイクル -----------------------------------------------------
 
@@ -66,31 +142,31 @@ class _ToioAsyncRunner:
 
     def set_motor(self, left: int, right: int) -> None:
         """
-        モータ値（整数、±100 程度）を非同期キューへ投入。
-        - キューには常に「最新 1 件」だけが残るようにする（古い指令は捨てる）
+        モータ値（整数、±100 程度）を 1 スロットの deque へ投入。
+        - スロットには常に「最新 1 件」だけが残る（古い指令は append で自然に捨てられる）
+        - ループの起床通知は未処理の通知が無いときだけ行う
+        - 直前に投入した指令と同じ値は捨てる（停止指令 (0, 0) は常に通す）
         """
         if self._stop_evt.is_set():
             return
 
-        def _put():
-            if self._queue is None:
+        cmd = (left, right)
+        with self._enq_lock:
+            if cmd == self._last_enqueued and cmd != (0, 0):
                 return
-            # 最新指令のみ保持：古いエントリを空にしてから put
-            try:
-                while True:
-                    self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                pass
-            self._queue.put_nowait((left, right))
+            self._last_enqueued = cmd
 
-        self._loop.call_soon_threadsafe(_put)
+        # 先にスロットを更新してからフラグを見る（ループ側は フラグ解除 → スロット読出し の順）
+        self._slot.append(cmd)
+        if not self._wake_pending:
+            self._wake_pending = True
+            self._loop.call_soon_threadsafe(self._wake.set)
 
     def stop(self) -> None:
-        """停止用の特殊メッセージを送ってスレッドを合流させる。"""
+        """停止フラグを立ててループを起こし、スレッドを合流させる。"""
         def _stop():
-            if self._queue is not None:
-                self._queue.put_nowait("STOP")
             self._stop_evt.set()
+            self._wake.set()
 
         self._loop.call_soon_threadsafe(_stop)
         self._thread.join(timeout=10.0)
@@ -100,7 +176,6 @@ class _ToioAsyncRunner:
     def _loop_main(self):
         """バックグラウンドスレッドのエントリポイント。"""
         asyncio.set_event_loop(self._loop)
-        self._queue = asyncio.Queue()
         try:
             self._loop.run_until_complete(self._runner())
         finally:
@@ -113,10 +188,13 @@ class _ToioAsyncRunner:
     async def _runner(self):
         """
         実際の BLE 接続とモータ送信ループ。
-        - まず toio ライブラリの自動スキャンで接続を試みる
-        - 失敗したら bleak でスキャン → 最初の toio を選んで、そのアドレスで再トライ
+        - 前回 bleak で見つけた toio があれば、スキャンせずにそのデバイスへ直接接続を試みる
+        - 次に toio ライブラリの自動スキャンで接続を試みる（prefer_bleak_scan=True なら省略）
+        - 失敗したら bleak でスキャン → 最初の toio を選んで、そのデバイスを指定して再トライ
         - アドレス指定の CLI/設定サポートは廃止（ユーザ指定は受け付けない）
         """
+        global _LAST_KNOWN_CUBE
+
         # toio ライブラリの存在確認
         try:
             from toio import ToioCoreCube  # type: ignore
@@ -128,14 +206,25 @@ class _ToioAsyncRunner:
             self._ready_evt.set()
             return
 
-        # ToioCoreCube の __init__ に存在する引数のみ渡すためのフィルタ
-        def _filter_kwargs_for_cube(**kwargs):
-            try:
-                sig = inspect.signature(ToioCoreCube)
-                return {k: v for k, v in kwargs.items() if k in sig.parameters and v is not None}
-            except Exception:
-                # 署名取得に失敗した場合は安全側で何も渡さない
+        # 接続先デバイスを直接指定するためのインタフェース（toio-py 1.1 系）
+        try:
+            from toio.device_interface.ble import BleCube  # type: ignore
+        except Exception:
+            BleCube = None
+
+        # アドレスを ToioCoreCube の __init__ に存在する引数名だけへ割り当てる
+        def _cube_kwargs(addr: Optional[str]) -> dict[str, str]:
+            if addr is None:
                 return {}
+            params = _get_cube_params(ToioCoreCube)
+            return {k: addr for k in _CUBE_ADDRESS_KEYS if k in params}
+
+        # bleak で見つけたデバイス（BLEDevice）を指定した ToioCoreCube を作る。指定できなければ None
+        def _cube_for(dev: Any) -> Any:
+            if BleCube is not None:
+                return ToioCoreCube(interface=BleCube(dev))
+            rk = _cube_kwargs(getattr(dev, "address", None))
+            return ToioCoreCube(**rk) if rk else None
 
         async def _motor_loop(cube) -> None:
             """接続確立後のモータ送信ループ（重複コード回避のため関数化）。"""
@@ -145,41 +234,110 @@ class _ToioAsyncRunner:
             except Exception:
                 pass
 
-            while not self._stop_evt.is_set():
+            next_ok = 0.0  # 次に書き込んでよい時刻（time.monotonic 基準）
+            while True:
                 try:
-                    msg = await asyncio.wait_for(self._queue.get(), timeout=0.5)
+                    await asyncio.wait_for(self._wake.wait(), timeout=0.5)
                 except asyncio.TimeoutError:
                     continue
-                if msg == "STOP":
+                self._wake.clear()
+                self._wake_pending = False
+
+                # 送信間隔の下限を守る（待機中に届いた指令はスロット上で最新 1 件に合流）
+                now = time.monotonic()
+                if now < next_ok and not self._stop_evt.is_set():
+                    await asyncio.sleep(next_ok - now)
+
+                if self._stop_evt.is_set():
                     try:
                         await cube.api.motor.motor_control(0, 0)
-                    finally:
-                        break
+                    except Exception:
+                        pass
+                    break
+                msg = self._slot.pop() if self._slot else None
+                if msg is None or msg == self._last_cmd:
+                    continue
                 left, right = msg
-                if self._last_cmd != (left, right):
-                    await cube.api.motor.motor_control(int(left), int(right))
-                    self._last_cmd = (left, right)
+                await cube.api.motor.motor_control(int(left), int(right))
+                self._last_cmd = msg
+                next_ok = time.monotonic() + self._ble_min_interval_s
+
+        # --- 0) 前回見つけた toio へ直接接続（スキャン時間を省く） ---
+        if _LAST_KNOWN_CUBE is not None:
+            try:
+                target = _cube_for(_LAST_KNOWN_CUBE)
+                if target is not None:
+                    async with target as cube:
+                        await _motor_loop(cube)
+                        return  # 正常終了
+            except Exception:
+                # 電源断/アドレス変化など → キャッシュを捨てて通常の手順へ
+                _LAST_KNOWN_CUBE = None
 
         # --- 1) toio ライブラリの自動スキャンに委ねてみる ---
-        try:
-            async with ToioCoreCube() as cube:
-                await _motor_loop(cube)
-                return  # 正常終了
-        except Exception:
-            # → 後段の bleak スキャンへ
-            pass
+        # 自動スキャンが通らない環境では、その内部タイムアウト分（数秒）だけ起動が遅れるので
+        # prefer_bleak_scan=True ならこの段を飛ばして bleak スキャンへ直行する
+        if not self._prefer_bleak_scan:
+            try:
+                async with ToioCoreCube() as cube:
+                    await _motor_loop(cube)
+                    return  # 正常終了
+            except Exception:
+                # → 後段の bleak スキャンへ
+                pass
 
         # --- 2) bleak でスキャン → 最初の toio を選んで接続 ---
         try:
             from bleak import BleakScanner  # type: ignore
 
-            devices = await BleakScanner.discover(timeout=self._ble_scan_timeout_s)
-            cand = [
-                d for d in devices
-                if (d.name or "").lower().startswith((self._ble_name_prefix or "toio").lower())
-            ]
+            # 最初の toio が見えた時点でスキャンを打ち切る（タイムアウトは上限としてのみ使う）
+            # 判定はサービス UUID（広告本体）か、名前プレフィックス（active 時のスキャン応答）のどちらか
+            prefix = (self._ble_name_prefix or "toio").lower()
+            service_uuid = str(_TOIO_SERVICE_UUID)
+            found = asyncio.Event()
+            cand = []
+            seen = {}  # エラー表示用: address → name
+
+            def _on_detect(dev, adv) -> None:
+                seen[getattr(dev, "address", "n/a")] = dev.name or "unknown"
+                if found.is_set():
+                    return
+                uuids = [u.lower() for u in (getattr(adv, "service_uuids", None) or ())]
+                if service_uuid in uuids or (dev.name or "").lower().startswith(prefix):
+                    cand.append(dev)
+                    found.set()
+
+            scanner_kwargs: dict[str, Any] = {}
+            if not self._ble_active_scan and sys.platform.startswith("linux"):
+                # BlueZ の passive スキャンには or_patterns が必須。
+                # passive ではスキャン応答（ローカル名）が届かないため、広告本体の 128bit サービス UUID で通す
+                # （UUID 18B + Flags 3B + 名前 16B は 31B に収まらず、名前は広告本体に載らない）
+                from bleak.args.bluez import OrPattern  # type: ignore
+                from bleak.assigned_numbers import AdvertisementDataType  # type: ignore
+
+                uuid_le = _TOIO_SERVICE_UUID.bytes[::-1]  # AD 構造体上の 128bit UUID はリトルエンディアン
+                scanner_kwargs["bluez"] = {
+                    "or_patterns": [
+                        OrPattern(0, AdvertisementDataType.COMPLETE_LIST_SERVICE_UUID128, uuid_le),
+                        OrPattern(0, AdvertisementDataType.INCOMPLETE_LIST_SERVICE_UUID128, uuid_le),
+                    ]
+                }
+
+            scanner = BleakScanner(
+                detection_callback=_on_detect,
+                scanning_mode="active" if self._ble_active_scan else "passive",
+                **scanner_kwargs,
+            )
+            await scanner.start()
+            try:
+                await asyncio.wait_for(found.wait(), timeout=self._ble_scan_timeout_s)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                await scanner.stop()
+
             if not cand:
-                names = [(d.name or "unknown", getattr(d, "address", "n/a")) for d in devices]
+                names = [(name, address) for address, name in seen.items()]
                 raise RuntimeError(
                     "BLE スキャンで toio Core Cube が見つかりませんでした。\n"
                     "- Cube をペアリング/アドバタイズ状態にする\n"
@@ -188,21 +346,18 @@ class _ToioAsyncRunner:
                     f"Scanned devices: {names}"
                 )
 
-            addr = getattr(cand[0], "address", None)
+            # 見つけたデバイスを指定して接続（BleCube、無ければアドレス系の引数で指定）
+            target = _cube_for(cand[0])
 
-            # toio ライブラリの引数差を吸収して「それっぽいキー群」を渡す
-            retry_kwargs = {}
-            for key in ("address", "mac_address", "device", "target", "target_addr"):
-                retry_kwargs[key] = addr
-            rk = _filter_kwargs_for_cube(**retry_kwargs)
-
-            # 署名上、どの引数も受け付けない場合は（古い実装など）引数なしで再トライ
-            if not rk:
+            # どちらでも指定できない場合は（古い実装など）引数なしで再トライ
+            if target is None:
                 async with ToioCoreCube() as cube:
                     await _motor_loop(cube)
                     return
 
-            async with ToioCoreCube(**rk) as cube:
+            async with target as cube:
+                # 接続できた toio を覚えておき、次回の接続でスキャンを省く
+                _LAST_KNOWN_CUBE = cand[0]
                 await _motor_loop(cube)
                 return  # 正常終了
 
@@ -246,24 +401,58 @@ class Toio(Robot):
         self._last_vx: float = 0.0
         self._last_vy: float = 0.0
 
+        # 直前にランナーへ渡した (L, R)。同じ値ならスレッド間の受け渡し自体を省く
+        self._prev_LR: tuple[int, int] | None = None
+
         # BLE ランナー（※ BLE アドレス指定は廃止）
         self._runner = _ToioAsyncRunner(
-            ble_name_prefix=str(getattr(config, "ble_name_prefix", "toio")),
-            ble_scan_timeout_s=float(getattr(config, "ble_scan_timeout_s", 8.0)),
+            ble_name_prefix=str(config.ble_name_prefix),
+            ble_scan_timeout_s=float(config.ble_scan_timeout_s),
+            prefer_bleak_scan=bool(config.prefer_bleak_scan),
+            ble_active_scan=bool(config.ble_active_scan),
+            ble_min_interval_s=float(config.ble_min_interval_s),
         )
 
         # モータ変換ゲイン
-        self._max_motor: int = int(getattr(config, "max_motor", 80))
-        self._kv: float = float(getattr(config, "kv", self._max_motor))  # 前後
-        self._kw: float = float(getattr(config, "kw", 40.0))             # 旋回（相対比は kw/kv）
-        self._deadzone: float = float(getattr(config, "deadzone", 0.05))
-
+        self._max_motor: int = int(config.max_motor)
+        self._kv: float = float(config.kv)                # 前後
+        self._kw: float = float(config.kw)                # 旋回（相対比は kw/kv）
+        self._deadzone: float = float(config.deadzone)
+
+        # send_action の毎tick計算を避けるため、デッドゾーン閾値とクリップ上限を前計算
+        self._dz: int = int(self._max_motor * self._deadzone)
+        self._m: int = self._max_motor
+
+        # 差動二輪の混合行列: [L, R]^T = _MIX @ [vy, vx]^T（mix_actions_batch 用）
+        # 入力・演算とも float32 で統一する（float64 の入力が混ざると行列積ごと昇格するため）
+        self._MIX: np.ndarray = np.array(
+            [[self._kv, -self._kw], [self._kv, self._kw]], dtype=np.float32
+        )
         # 画像 shape（ゼロ画像フォールバック用）
         self._cam_shape: dict[str, tuple[int, int, int]] = {
             cam_key: (config.cameras[cam_key].height, config.cameras[cam_key].width, 3)
             for cam_key in self.cameras
         }
 
+        # ゼロ画像は毎フレーム確保せず、読み取り専用の配列を 1 度だけ作って使い回す
+        self._zero_frame: dict[str, np.ndarray] = {
+            cam_key: np.zeros(shape, dtype=np.uint8) for cam_key, shape in self._cam_shape.items()
+        }
+        for arr in self._zero_frame.values():
+            arr.setflags(write=False)
+
+        # 観測 dict の雛形（キー構成は固定なので毎 tick 作り直さず、値だけ差し替える）
+        self._obs_skel: dict[str, Any] = {"vx": 0.0, "vy": 0.0, **self._zero_frame}
+
+        # カメラごとの読み取り関数（connect 時に 1 度だけ解決する）
+        self._cam_readers: dict[str, Callable[[], Optional[np.ndarray]]] = {}
+
+        # カメラ読み取りを並列化するスレッドプール（connect で生成、disconnect で破棄）
+        self._cam_pool: Optional[ThreadPoolExecutor] = None
+        # カメラごとに実行中の読み取り（同じカメラへの同時読み取り・ワーカの詰まりを防ぐため 1 件まで）
+        self._cam_futures: dict[str, Future] = {}
+        self._cam_read_timeout_s: float = float(config.camera_read_timeout_s)
+
     # ===== 接続系 =====
 
     def connect(self, calibrate: bool = True) -> None:
@@ -274,15 +463,23 @@ class Toio(Robot):
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
-        # カメラ接続
-        for cam in self.cameras.values():
+        # カメラ接続（読み取り関数もここで確定させ、毎フレームの hasattr を避ける）
+        for cam_key, cam in self.cameras.items():
             cam.connect()
+            self._cam_readers[cam_key] = _make_cam_reader(cam)
 
         # BLE 起動（完了まで待つ）
         self._runner.start(timeout=30.0)
+        self._prev_LR = None
+
+        # 読み取り用スレッドプールは BLE 起動に成功してから作る（失敗時にスレッドを残さない）
+        if self._cam_readers:
+            self._cam_pool = ThreadPoolExecutor(
+                max_workers=len(self._cam_readers), thread_name_prefix="toio-cam"
+            )
 
         self._is_connected = True
-        print(f"{self} connected (toio BLE & cameras).")
+        logger.info(f"{self} connected (toio BLE & cameras).")
 
     def disconnect(self) -> None:
         """停止指令を送ってから、BLE/カメラを順に切断。"""
@@ -293,10 +490,21 @@ class Toio(Robot):
         except Exception:
             pass
         self._runner.stop()
+        if self._cam_pool is not None:
+            # 実行中の読み取りは camera_read_timeout_s まで待つ（read() にはタイムアウトが無く、
+            # 固まったカメラで disconnect ごと止まらないよう無期限には待たない）
+            if self._cam_futures:
+                _, pending = wait(self._cam_futures.values(), timeout=self._cam_read_timeout_s)
+                for cam_key, fut in self._cam_futures.items():
+                    if fut in pending:
+                        logger.warning(f"{self} camera '{cam_key}' read still running at disconnect; not waiting for it")
+            self._cam_pool.shutdown(wait=False, cancel_futures=True)
+            self._cam_pool = None
+        self._cam_futures.clear()
         for cam in self.cameras.values():
             cam.disconnect()
         self._is_connected = False
-        print(f"{self} disconnected.")
+        logger.info(f"{self} disconnected.")
 
     # ===== Robot 抽象メソッドの最小実装 =====
 
@@ -367,51 +575,80 @@ class Toio(Robot):
         L = int(round(self._kv * vy - self._kw * vx))
         R = int(round(self._kv * vy + self._kw * vx))
 
-        # --- デッドゾーン処理（小さい値は 0 に潰す） ---
-        dz = int(self._max_motor * self._deadzone)
-        if abs(L) < dz:
-            L = 0
-        if abs(R) < dz:
-            R = 0
+        # --- デッドゾーン（小さい値は 0 に潰す）＋クリップ（±max_motor）を 1 式で ---
+        dz, m = self._dz, self._m
+        L = 0 if -dz < L < dz else max(-m, min(m, L))
+        R = 0 if -dz < R < dz else max(-m, min(m, R))
 
-        # --- クリップ（±max_motor） ---
-        L = _clip(L, -self._max_motor, self._max_motor)
-        R = _clip(R, -self._max_motor, self._max_motor)
-
-        # --- 非同期で実機へ送信 ---
-        self._runner.set_motor(L, R)
+        # --- 非同期で実機へ送信（直前と同じ指令なら省略。観測用のエコーは上で更新済み） ---
+        if (L, R) != self._prev_LR:
+            self._prev_LR = (L, R)
+            self._runner.set_motor(L, R)
 
         # データセットには送った action をそのまま返す（エコー）
         return {"vx": vx, "vy": vy}
 
+    def mix_actions_batch(self, vx: np.ndarray, vy: np.ndarray) -> np.ndarray:
+        """
+        N ステップ分のアクション（vx, vy の 1 次元配列）を NumPy で一括して (L, R) に変換する。
+        - 変換のみで実機へは送らない（リプレイ/模倣学習側での検証・前処理用。送信は send_action で 1 ステップずつ）
+        - 入力・混合は float32 で行う（帯域が半分で済み、下流の PyTorch パイプラインとも型が揃う）
+        - 丸め・デッドゾーン・クリップの手順は send_action と同じだが、混合の精度差により
+          .5 付近の丸めで send_action（float64）と L/R が ±1 ずれることがある
+          （小数 3 桁の乱数 2 万件で約 0.8%）。デッドゾーン境界では ±1 の差が「0 か dz か」の差になる
+        - 戻り値は (N, 2) の int16 配列（列は L, R。max_motor によらず型は固定）
+        """
+        vx = np.asarray(vx, dtype=np.float32).reshape(-1)
+        vy = np.asarray(vy, dtype=np.float32).reshape(-1)
+        if vx.shape != vy.shape:
+            raise ValueError(f"vx and vy must have the same length (got {vx.shape[0]} and {vy.shape[0]})")
+
+        # --- 差動二輪への混合 → 整数丸め（np.rint は round と同じ偶数丸め） → デッドゾーン → クリップ ---
+        xy = np.stack([vy, vx], axis=1)
+        LR = np.rint(xy @ self._MIX.T)
+        LR[np.abs(LR) < self._dz] = 0
+        np.clip(LR, -self._m, self._m, out=LR)
+        return LR.astype(np.int16)
+
     def get_observation(self) -> dict[str, Any]:
         """
         観測を取得。
         - 本実装では「直近の vx, vy のエコー」＋「各カメラの最新フレーム」
+        - 各カメラの読み取りはスレッドプールで並列に行う（待ちは全カメラで camera_read_timeout_s まで）
+        - 時間内に終わらなかった読み取りは次回以降に持ち越し、完了するまで同じカメラへは再投入しない
         - カメラ取得に失敗/未到達のときはゼロ画像でフォールバック
+        - 戻り値は雛形 dict の浅いコピー（呼び出し側で変更しても次回の観測には影響しない）
         """
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        obs: dict[str, Any] = {"vx": float(self._last_vx), "vy": float(self._last_vy)}
+        obs = self._obs_skel
+        obs["vx"] = float(self._last_vx)
+        obs["vy"] = float(self._last_vy)
 
-        # カメラフレーム取得（フォールバックあり）
-        for cam_key, cam in self.cameras.items():
-            h, w, c = self._cam_shape[cam_key]
+        if self._cam_pool is None:
+            return obs.copy()
+
+        # カメラフレーム取得（前回から持ち越した読み取りがあるカメラには新たに投入しない）
+        futures = self._cam_futures
+        for cam_key, reader in self._cam_readers.items():
+            if cam_key not in futures:
+                futures[cam_key] = self._cam_pool.submit(reader)
+        wait(futures.values(), timeout=self._cam_read_timeout_s)
+
+        for cam_key in self._cam_readers:
+            fut = futures[cam_key]
             frame = None
-            try:
-                if hasattr(cam, "async_read"):
-                    frame = cam.async_read()
-                elif hasattr(cam, "read"):
-                    ok, frame = cam.read()
-                    if ok is False:
-                        frame = None
-            except Exception:
-                frame = None
+            if fut.done():
+                del futures[cam_key]
+                try:
+                    frame = fut.result()
+                except Exception:
+                    frame = None
 
-            if frame is None or not isinstance(frame, np.ndarray):
-                frame = np.zeros((h, w, c), dtype=np.uint8)
+            if frame is None:
+                frame = self._zero_frame[cam_key]
 
             obs[cam_key] = frame
 
-        return obs
+        return obs.copy()
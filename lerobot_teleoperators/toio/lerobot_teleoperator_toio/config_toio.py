@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 """
 toio のテレオペ (leader) 用 TeleoperatorConfig。
-- pygame で取得するジョイスティックの軸割り当て/反転/スケール/デッドゾーン等をここで調整します。
+- pygame（Linux では evdev も可）で取得するジョイスティックの軸割り当て/反転/スケール/デッドゾーン等をここで調整します。
 """
 
 from dataclasses import dataclass
+from typing import Literal
 from lerobot.teleoperators.config import TeleoperatorConfig
 
 @TeleoperatorConfig.register_subclass("toio_leader")
@@ -15,6 +16,7 @@ class ToioConfig(TeleoperatorConfig):
     use_gripper: bool = False  # 本テレオペではグリッパは扱いません（互換のFalseため残置）
 
     # ---- 入力デバイス（ジョイスティック）設定 ----
+    backend: Literal["pygame", "evdev"] = "pygame"  # 軸の読み取り方式: "pygame" | "evdev"（evdev は Linux のみ有効）
     joystick_index: int = 0          # 使用するジョイスティック番号（複数繋いだ場合に変更）
     axis_x_index: int = 0            # vx に使う軸番号（既定: X 軸）
     axis_y_index: int = 2            # vy に使う軸番号（既定: 多くのパッドで右/左スティックの Y）
@@ -24,3 +26,9 @@ class ToioConfig(TeleoperatorConfig):
     # ---- 入力整形パラメータ ----
     speed: float = 0.5               # 出力スケール（-1..1 の軸値に掛ける係数、最終的に [-1..1] にクリップ）
     deadzone: float = 0.08           # デッドゾーン（|v| < deadzone は 0 とみなす）
+
+    # ---- 読み取りスレッド ----
+    # True で軸の読み取りを専用デーモンスレッドへ移し、get_action は最新値を返すだけにする。
+    # macOS の SDL はイベント処理をメインスレッドに限定するため、既定は False（従来どおり）。
+    poll_in_thread: bool = False
+    poll_interval_s: float = 0.005   # 読み取りスレッドのポーリング周期[s]
@@ -2,6 +2,7 @@
 """
 toio 用テレオペレーター（leader 側）。
 pygame でゲームパッドの軸値を読み取り、毎フレーム {vx, vy} を返します。
+Linux では backend="evdev" で /dev/input/event* を直接読むこともできます（SDL のイベント層を経由しない）。
 
 設計方針
 - 軸値は [-1..1] を想定。反転・デッドゾーン・スケーリングを適用してから Robot へ渡します。
@@ -11,7 +12,10 @@ pygame でゲームパッドの軸値を読み取り、毎フレーム {vx, vy}
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
+import logging
+import sys
+import threading
 
 # lerobot base
 from lerobot.teleoperators.teleoperator import Teleoperator
@@ -19,10 +23,25 @@ from lerobot.teleoperators.teleoperator import Teleoperator
 # 同パッケージ内のテレオペ設定
 from .config_toio import ToioConfig
 
+logger = logging.getLogger(__name__)
 
-def _clip(v: float, lo: float, hi: float) -> float:
-    """浮動小数点 v を [lo, hi] にクリップする小ヘルパ。"""
-    return lo if v < lo else hi if v > hi else v
+
+def _is_evdev_joystick(dev: Any, ecodes: Any) -> bool:
+    """
+    evdev デバイスがジョイスティック/ゲームパッドかを SDL と同じ基準で判定する。
+    - ABS_X / ABS_Y を持ち、BTN_JOYSTICK..BTN_THUMBR のボタンを 1 つ以上持つ
+    - ポインタ/直接入力デバイス（タッチパッド・タッチパネル）は除外
+    タッチパッドやモーションセンサのノードを拾うと、静止時の値が軸入力になって勝手に走り出すため。
+    """
+    # absinfo=True（既定）だと EV_ABS が (code, AbsInfo) のタプルになるため、コードだけを取り出す
+    caps = dev.capabilities(absinfo=False)
+    abs_codes = set(caps.get(ecodes.EV_ABS, ()))
+    if ecodes.ABS_X not in abs_codes or ecodes.ABS_Y not in abs_codes:
+        return False
+    if not any(ecodes.BTN_JOYSTICK <= code <= ecodes.BTN_THUMBR for code in caps.get(ecodes.EV_KEY, ())):
+        return False
+    props = set(dev.input_props())
+    return ecodes.INPUT_PROP_POINTER not in props and ecodes.INPUT_PROP_DIRECT not in props
 
 
 class Toio(Teleoperator):
@@ -51,19 +70,43 @@ class Toio(Teleoperator):
         # pygame / joystick は遅延 import（環境によって未導入の可能性があるため）
         self._pg = None                    # pygame モジュール
         self._joy = None                   # pygame.joystick.Joystick インスタンス
+        self._joy_id: int = -1             # JOYAXISMOTION の instance_id 照合用
+        self._num_axes: int = 0            # 接続時に取得した軸数
+
+        # evdev バックエンド（Linux のみ）
+        self._ev = None                    # evdev モジュール
+        self._ev_dev = None                # evdev.InputDevice インスタンス
+        # EV_ABS のコード → (軸番号, 最小値, 正規化係数)。値は (v - min) * k - 1 で [-1, 1] へ
+        self._abs_map: dict[int, tuple[int, int, float]] = {}
+
+        # 軸ごとの最新値キャッシュ（JOYAXISMOTION イベントで更新）
+        self._axis_cache: dict[int, float] = {}
 
         # 警告を一度だけ表示するためのフラグ
         self._warned_no_joy = False
         self._warned_axis = False
-
-        # ---- config 値の取り込み（フォールバックは dataclass 側の既定値）----
-        self._joy_index = int(getattr(config, "joystick_index", 0))
-        self._axis_x_idx = int(getattr(config, "axis_x_index", 0))
-        self._axis_y_idx = int(getattr(config, "axis_y_index", 2))
-        self._invert_x = bool(getattr(config, "invert_x", True))
-        self._invert_y = bool(getattr(config, "invert_y", True))
-        self._speed = float(getattr(config, "speed", 0.5))
-        self._deadzone = float(getattr(config, "deadzone", 0.08))
+        self._warned_poll = False
+
+        # ---- config 値の取り込み（既定値は ToioConfig 側に一元化）----
+        self._backend = str(config.backend)
+        if self._backend not in ("pygame", "evdev"):
+            # 綴り間違いで黙って pygame に落ちないよう、未知の値はここで弾く
+            raise ValueError(f"backend must be 'pygame' or 'evdev' (got {self._backend!r})")
+        self._joy_index = int(config.joystick_index)
+        self._axis_x_idx = int(config.axis_x_index)
+        self._axis_y_idx = int(config.axis_y_index)
+        self._invert_x = bool(config.invert_x)
+        self._invert_y = bool(config.invert_y)
+        self._speed = float(config.speed)
+        self._deadzone = float(config.deadzone)
+
+        # ---- 読み取りスレッド（poll_in_thread=True のときのみ使用）----
+        self._poll_in_thread = bool(config.poll_in_thread)
+        self._poll_interval_s = float(config.poll_interval_s)
+        self._axis_thread: Optional[threading.Thread] = None
+        self._stop_evt = threading.Event()
+        # 最新の (vx, vy)。タプル 1 個の代入なので GIL 下でも読み手に半端な値は見えない
+        self._latest: tuple[float, float] = (0.0, 0.0)
 
     # ----- Teleoperator interface -----
 
@@ -88,10 +131,33 @@ class Toio(Teleoperator):
 
     def connect(self, calibrate: bool = True) -> None:
         """
-        pygame を初期化し、指定のジョイスティック（config.joystick_index）をオープン。
-        - pygame 未導入時は明示的に ImportError を投げ、対処方法を表示
+        指定のジョイスティック（config.joystick_index）をオープン。
+        - backend="evdev" かつ Linux なら evdev、それ以外は pygame を使う
+        - ライブラリ未導入時は明示的に ImportError を投げ、対処方法を表示
         - ジョイスティックが見つからない場合は vx,vy=0 のまま動作（警告は一度だけ）
         """
+        use_evdev = self._backend == "evdev"
+        if use_evdev and not sys.platform.startswith("linux"):
+            logger.warning("[teleop/joystick] backend='evdev' は Linux 専用のため pygame を使用します")
+            use_evdev = False
+
+        if use_evdev:
+            self._connect_evdev()
+        else:
+            self._connect_pygame()
+
+        self._connected = True
+
+        # 軸の読み取りを専用スレッドへ移し、Robot ループの停滞と teleop の遅延を切り離す
+        if self._poll_in_thread:
+            self._stop_evt.clear()
+            self._axis_thread = threading.Thread(
+                target=self._axis_loop, name="toio-teleop-axes", daemon=True
+            )
+            self._axis_thread.start()
+
+    def _connect_pygame(self) -> None:
+        """pygame を初期化し、ジョイスティックをオープンする。"""
         try:
             import pygame  # type: ignore
         except Exception as e:
@@ -105,19 +171,87 @@ class Toio(Teleoperator):
 
         cnt = pygame.joystick.get_count()
         if cnt <= 0:
-            print("[teleop/joystick] No joystick detected (vx, vy は 0 のままになります)")
+            logger.warning("[teleop/joystick] No joystick detected (vx, vy は 0 のままになります)")
             self._joy = None
         else:
             # 指定 index が範囲外なら 0 にフォールバック
             ji = self._joy_index if 0 <= self._joy_index < cnt else 0
             self._joy = pygame.joystick.Joystick(ji)
             self._joy.init()
-            print(
+            self._joy_id = self._joy.get_instance_id()
+            self._num_axes = self._joy.get_numaxes()
+            # 以降はイベントでの差分更新になるため、現在値で初期化しておく
+            self._axis_cache = {i: float(self._joy.get_axis(i)) for i in range(self._num_axes)}
+            logger.info(
                 f"[teleop/joystick] Connected to: {self._joy.get_name()} "
-                f"(index={ji}, axes={self._joy.get_numaxes()})"
+                f"(index={ji}, axes={self._num_axes})"
             )
 
-        self._connected = True
+        # 軸イベント以外はキューに積ませない（毎フレーム取り出す件数を軸の変化分に抑える）
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.JOYAXISMOTION])
+
+    def _connect_evdev(self) -> None:
+        """
+        evdev でジョイスティック/ゲームパッドを列挙し、joystick_index 番目をオープンする。
+        - 判定は SDL と同じ基準（_is_evdev_joystick）なので、index は pygame バックエンドと概ね一致する
+        - 軸番号は SDL と同じく、ハット以外の ABS コードを昇順に並べた順で割り当てる
+        """
+        try:
+            import evdev  # type: ignore
+        except Exception as e:
+            raise ImportError(
+                "evdev が見つかりません。`pip install evdev` を実行してください。"
+            ) from e
+
+        self._ev = evdev
+        ecodes = evdev.ecodes
+        hat_codes = range(ecodes.ABS_HAT0X, ecodes.ABS_HAT3Y + 1)
+
+        pads = []
+        # /dev/input/eventN を N の昇順に並べ、index の割り当てを毎回同じにする
+        paths = sorted(evdev.list_devices(), key=lambda p: (len(p), p))
+        for path in paths:
+            try:
+                dev = evdev.InputDevice(path)
+            except OSError:
+                continue
+            if _is_evdev_joystick(dev, ecodes):
+                pads.append(dev)
+            else:
+                dev.close()
+
+        if not pads:
+            logger.warning("[teleop/joystick] No joystick detected (vx, vy は 0 のままになります)")
+            self._ev_dev = None
+            return
+
+        # 指定 index が範囲外なら 0 にフォールバック
+        ji = self._joy_index if 0 <= self._joy_index < len(pads) else 0
+        for i, dev in enumerate(pads):
+            if i != ji:
+                dev.close()
+        dev = pads[ji]
+
+        abs_caps = sorted(dev.capabilities(absinfo=True)[ecodes.EV_ABS], key=lambda c: c[0])
+        self._abs_map = {}
+        self._axis_cache = {}
+        for code, info in abs_caps:
+            if code in hat_codes:
+                continue
+            idx = len(self._abs_map)
+            span = info.max - info.min
+            k = 2.0 / span if span > 0 else 0.0
+            self._abs_map[code] = (idx, info.min, k)
+            # 以降はイベントでの差分更新になるため、現在値で初期化しておく
+            self._axis_cache[idx] = (info.value - info.min) * k - 1.0 if span > 0 else 0.0
+
+        self._ev_dev = dev
+        self._num_axes = len(self._abs_map)
+        logger.info(
+            f"[teleop/joystick] Connected to: {dev.name} "
+            f"(evdev {dev.path}, axes={self._num_axes})"
+        )
 
     def calibrate(self) -> None:
         """特別なキャリブレーションは不要。"""
@@ -128,8 +262,12 @@ class Toio(Teleoperator):
         return
 
     def disconnect(self) -> None:
-        """pygame / joystick をクリーンに終了。"""
+        """読み取りスレッドを止めてから、pygame / joystick をクリーンに終了。"""
         self._connected = False
+        self._stop_evt.set()
+        if self._axis_thread is not None:
+            self._axis_thread.join(timeout=1.0)
+            self._axis_thread = None
         try:
             if self._joy is not None:
                 self._joy.quit()
@@ -141,8 +279,17 @@ class Toio(Teleoperator):
                 self._pg.quit()
         except Exception:
             pass
+        try:
+            if self._ev_dev is not None:
+                self._ev_dev.close()
+        except Exception:
+            pass
         self._joy = None
         self._pg = None
+        self._ev_dev = None
+        self._ev = None
+        self._abs_map = {}
+        self._axis_cache = {}
 
     # ========= 内部ユーティリティ =========
 
@@ -156,33 +303,70 @@ class Toio(Teleoperator):
         if abs(v) < self._deadzone:
             v = 0.0
         # 念のため軸値自体を [-1,1] に収めてからスケール
-        v = _clip(v, -1.0, 1.0)
+        v = max(-1.0, min(1.0, v))
         v = self._speed * v
         # speed が 1 を超えている場合も想定し、最終クリップを行う
-        return float(_clip(v, -1.0, 1.0))
+        return float(max(-1.0, min(1.0, v)))
+
+    def _drain_pygame(self) -> None:
+        """溜まった pygame の軸イベントだけを取り出し、軸ごとの最新値を更新。"""
+        events = self._pg.event.get()
+        if self._joy is None:
+            return
+        axis_motion = self._pg.JOYAXISMOTION
+        for ev in events:
+            if ev.type == axis_motion and ev.instance_id == self._joy_id:
+                self._axis_cache[ev.axis] = ev.value
+
+    def _drain_evdev(self) -> None:
+        """
+        evdev デバイスからノンブロッキングで EV_ABS を読み、軸ごとの最新値を更新。
+        - 読むべきイベントが無ければ BlockingIOError（= 変化なし）
+        - デバイスが抜かれた等の OSError では停止側（0）に倒し、以降は未検出扱い
+        """
+        ev_abs = self._ev.ecodes.EV_ABS
+        try:
+            for ev in self._ev_dev.read():
+                if ev.type == ev_abs:
+                    m = self._abs_map.get(ev.code)
+                    if m is not None:
+                        idx, lo, k = m
+                        self._axis_cache[idx] = (ev.value - lo) * k - 1.0
+        except BlockingIOError:
+            pass
+        except OSError:
+            logger.warning("[teleop/joystick] evdev device lost (vx,vy=0)")
+            try:
+                self._ev_dev.close()
+            except Exception:
+                pass
+            self._ev_dev = None
+            self._axis_cache = {}
 
     def _read_axes(self) -> None:
         """
-        pygame から最新の軸値を取り出して内部状態（_vx, _vy）を更新。
+        軸イベントで最新値キャッシュを更新し、内部状態（_vx, _vy）を計算。
         - ジョイスティック未接続時は 0 を維持し、一度だけ警告。
         - 軸数が不足している場合は安全なフォールバック（例: Y → axis1）へ切替。
         """
-        if self._pg is None:
+        if not self._connected:
             # 未接続（connect 前）なら何もしない
             return
 
-        # イベントキューを処理（内部状態更新のために必要）
-        self._pg.event.pump()
+        if self._ev_dev is not None:
+            self._drain_evdev()
+        elif self._pg is not None:
+            self._drain_pygame()
 
-        if self._joy is None:
+        if self._joy is None and self._ev_dev is None:
             # ジョイスティック未検出：常に 0 を出力
             self._vx, self._vy = 0.0, 0.0
             if not self._warned_no_joy:
-                print("[teleop/joystick] Warning: joystick not available (vx,vy=0)")
+                logger.warning("[teleop/joystick] joystick not available (vx,vy=0)")
                 self._warned_no_joy = True
             return
 
-        num_axes = self._joy.get_numaxes()
+        num_axes = self._num_axes
 
         # 軸インデックスの安全化
         ax_x = self._axis_x_idx
@@ -195,16 +379,13 @@ class Toio(Teleoperator):
                 # 1 本以下しかない場合は 0 固定
                 self._vx, self._vy = 0.0, 0.0
                 if not self._warned_axis:
-                    print(f"[teleop/joystick] Warning: not enough axes (have {num_axes})")
+                    logger.warning(f"[teleop/joystick] not enough axes (have {num_axes})")
                     self._warned_axis = True
                 return
 
         # 軸値の取得（-1..1 の想定だが、念のためクリップ）
-        try:
-            x = float(self._joy.get_axis(ax_x))
-            y = float(self._joy.get_axis(ax_y))
-        except Exception:
-            x, y = 0.0, 0.0
+        x = float(self._axis_cache.get(ax_x, 0.0))
+        y = float(self._axis_cache.get(ax_y, 0.0))
 
         # 反転（多くのパッドで Y: 上がマイナス → + に揃える）
         if self._invert_x:
@@ -212,9 +393,23 @@ class Toio(Teleoperator):
         if self._invert_y:
             y = -y
 
-        # デッドゾーン＆スケール＆クリップを適用
-        self._vx = self._apply_deadzone_and_scale(_clip(x, -1.0, 1.0))
-        self._vy = self._apply_deadzone_and_scale(_clip(y, -1.0, 1.0))
+        # デッドゾーン＆スケール＆クリップを適用（[-1, 1] への事前クリップも内部で行う）
+        self._vx = self._apply_deadzone_and_scale(x)
+        self._vy = self._apply_deadzone_and_scale(y)
+
+    def _axis_loop(self) -> None:
+        """読み取りスレッド本体。一定周期で軸を読み、最新値スナップショットを更新する。"""
+        while not self._stop_evt.is_set():
+            try:
+                self._read_axes()
+            except Exception as e:
+                # 読み取り失敗ではスレッドを落とさないが、出力は停止側（0）に倒し、原因は一度だけ警告に残す
+                self._vx, self._vy = 0.0, 0.0
+                if not self._warned_poll:
+                    logger.warning(f"[teleop/joystick] axis polling thread failed to read axes: {e!r}")
+                    self._warned_poll = True
+            self._latest = (self._vx, self._vy)
+            self._stop_evt.wait(self._poll_interval_s)
 
     # ========= メイン I/O =========
 
@@ -222,9 +417,14 @@ class Toio(Teleoperator):
         """
         毎フレーム呼ばれるエントリ。最新の {vx, vy} を返す。
         - Robot ループがこの戻り値をそのまま受け取り、差動二輪へ変換します。
+        - 読み取りスレッド使用時は、スレッドが更新した最新値をブロックせずに返すだけ。
         """
-        self._read_axes()
-        return {"vx": float(self._vx), "vy": float(self._vy)}
+        if self._axis_thread is not None:
+            vx, vy = self._latest
+        else:
+            self._read_axes()
+            vx, vy = self._vx, self._vy
+        return {"vx": float(vx), "vy": float(vy)}
 
     def send_feedback(self, feedback: dict[str, float]) -> None:
         """本テレオペではフィードバックは扱わない（no-op）。"""